@@ -0,0 +1,8 @@
+from typing import Final
+
+
+class Profiling:
+
+    HEADER: Final[str] = "X-Profile-Token"
+    FILE_PREFIX: Final[str] = "profile_"
+    FILE_SUFFIX: Final[str] = ".prof"
@@ -17,7 +17,10 @@ from errors.unexpected_response_error import UnexpectedResponseError
 
 from services.apis.compliance_check import ComplianceCheckService
 
+from start_utils import PROFILING_ENABLED
+
 from utilities.dictionary import DictionaryUtility
+from utilities.profiler import ProfilerUtility
 
 
 class ComplianceCheckController(IController):
@@ -34,6 +37,16 @@ class ComplianceCheckController(IController):
         self.logger = self.logger.bind(urn=self.urn, api_name=self.api_name)
         self.dictionary_utility = DictionaryUtility(urn=self.urn)
 
+        if PROFILING_ENABLED:
+            profiler_utility = ProfilerUtility(urn=self.urn, api_name=self.api_name)
+            if profiler_utility.should_profile(request=request):
+                async with profiler_utility.profile():
+                    return await self.__process(request=request, request_payload=request_payload)
+
+        return await self.__process(request=request, request_payload=request_payload)
+
+    async def __process(self, request: Request, request_payload: ComplianceCheckRequestDTO) -> JSONResponse:
+
         try:
 
             self.logger.debug("Validating request")
@@ -15,6 +15,19 @@ logger.debug("Loaded environment variables from .env file")
 logger.info("Loading environment variables")
 APP_NAME: str = os.environ.get('APP_NAME')
 GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY")
+PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+try:
+    PROFILING_SAMPLE_RATE: float = min(max(float(os.getenv("PROFILING_SAMPLE_RATE", "0")), 0.0), 1.0)
+except ValueError:
+    logger.warning("Invalid PROFILING_SAMPLE_RATE, disabling sampled profiling")
+    PROFILING_SAMPLE_RATE: float = 0.0
+PROFILING_DIR: str = os.getenv("PROFILING_DIR", "/app/temp")
+try:
+    PROFILING_MAX_FILES: int = max(int(os.getenv("PROFILING_MAX_FILES", "50")), 1)
+except ValueError:
+    logger.warning("Invalid PROFILING_MAX_FILES, defaulting to 50")
+    PROFILING_MAX_FILES: int = 50
+PROFILING_ENABLED: bool = bool(PROFILING_TOKEN) or PROFILING_SAMPLE_RATE > 0
 logger.info("Loaded environment variables")
 
 logger.info("Initializing conversation llm")
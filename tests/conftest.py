@@ -0,0 +1,7 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# start_utils builds the Gemini client at import time and needs a key to do so.
+os.environ.setdefault("GOOGLE_API_KEY", "test")
@@ -0,0 +1,43 @@
+import os
+
+from fastapi.testclient import TestClient
+
+import controllers.apis.compliance_check as controller_module
+import utilities.profiler as profiler_module
+
+from app import app
+
+from constants.api_status import APIStatus
+from constants.profiling import Profiling
+
+from dtos.responses.base import BaseResponseDTO
+
+from services.apis.compliance_check import ComplianceCheckService
+
+
+def test_non_ascii_token_returns_normal_response(monkeypatch, tmp_path):
+
+    async def run(self, data: dict):
+        return BaseResponseDTO(
+            transactionUrn=self.urn,
+            status=APIStatus.SUCCESS,
+            responseMessage="ok",
+            responseKey="success_compliance_check",
+            data={"url": data.get("url")}
+        )
+
+    monkeypatch.setattr(ComplianceCheckService, "run", run)
+    monkeypatch.setattr(controller_module, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(profiler_module, "PROFILING_TOKEN", "secret")
+    monkeypatch.setattr(profiler_module, "PROFILING_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(profiler_module, "PROFILING_DIR", str(tmp_path))
+
+    response = TestClient(app).post(
+        "/apis/compliance_check",
+        json={"reference_number": "ref", "url": "https://example.com/"},
+        headers={Profiling.HEADER: b"\xe9secret"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == APIStatus.SUCCESS
+    assert os.listdir(tmp_path) == []
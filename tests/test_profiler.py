@@ -0,0 +1,98 @@
+import asyncio
+import os
+
+from types import SimpleNamespace
+
+import pytest
+
+import utilities.profiler as profiler_module
+
+from constants.profiling import Profiling
+
+from utilities.profiler import ProfilerUtility
+
+
+def make_request(token: str = None) -> SimpleNamespace:
+    headers: dict = {} if token is None else {Profiling.HEADER: token}
+    return SimpleNamespace(headers=headers)
+
+
+def run_profiled(utility: ProfilerUtility) -> None:
+
+    async def profiled():
+        async with utility.profile():
+            sum(range(1000))
+
+    asyncio.run(profiled())
+
+
+def profile_names(directory) -> list:
+    return sorted(name for name in os.listdir(directory) if name.startswith(Profiling.FILE_PREFIX))
+
+
+@pytest.fixture
+def settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiler_module, "PROFILING_TOKEN", "secret")
+    monkeypatch.setattr(profiler_module, "PROFILING_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(profiler_module, "PROFILING_DIR", str(tmp_path))
+    monkeypatch.setattr(profiler_module, "PROFILING_MAX_FILES", 2)
+    return tmp_path
+
+
+def test_matching_token_is_profiled(settings):
+    utility = ProfilerUtility(urn="urn")
+    assert utility.should_profile(request=make_request("secret"))
+    assert utility.requested
+
+
+def test_mismatched_token_is_not_profiled(settings):
+    assert not ProfilerUtility(urn="urn").should_profile(request=make_request("wrong"))
+    assert not ProfilerUtility(urn="urn").should_profile(request=make_request())
+
+
+def test_non_ascii_token_is_not_profiled(settings):
+    # Starlette decodes header bytes as latin-1, yielding non-ASCII strings.
+    token: str = b"\xe9secret".decode("latin-1")
+    assert not ProfilerUtility(urn="urn").should_profile(request=make_request(token))
+
+
+def test_token_ignored_when_not_configured(settings, monkeypatch):
+    monkeypatch.setattr(profiler_module, "PROFILING_TOKEN", "")
+    assert not ProfilerUtility(urn="urn").should_profile(request=make_request(""))
+
+
+def test_sample_rate(settings, monkeypatch):
+    monkeypatch.setattr(profiler_module, "PROFILING_SAMPLE_RATE", 1.0)
+    utility = ProfilerUtility(urn="urn")
+    assert utility.should_profile(request=make_request())
+    assert not utility.requested
+
+
+def test_profile_is_written_by_urn(settings):
+    run_profiled(ProfilerUtility(urn="abc"))
+    assert profile_names(settings) == [f"{Profiling.FILE_PREFIX}abc{Profiling.FILE_SUFFIX}"]
+
+
+def test_profile_skipped_while_another_is_active(settings):
+    assert profiler_module._profiling_lock.acquire(blocking=False)
+    try:
+        run_profiled(ProfilerUtility(urn="abc"))
+    finally:
+        profiler_module._profiling_lock.release()
+    assert profile_names(settings) == []
+
+
+def test_old_profiles_are_pruned(settings):
+    for index, urn in enumerate(["old", "older", "oldest"]):
+        path = settings / f"{Profiling.FILE_PREFIX}{urn}{Profiling.FILE_SUFFIX}"
+        path.write_bytes(b"")
+        os.utime(path, (1000 - index, 1000 - index))
+    (settings / "unrelated.txt").write_text("kept")
+
+    run_profiled(ProfilerUtility(urn="new"))
+
+    assert profile_names(settings) == [
+        f"{Profiling.FILE_PREFIX}new{Profiling.FILE_SUFFIX}",
+        f"{Profiling.FILE_PREFIX}old{Profiling.FILE_SUFFIX}",
+    ]
+    assert (settings / "unrelated.txt").exists()
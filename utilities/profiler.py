@@ -0,0 +1,113 @@
+import asyncio
+import cProfile
+import hmac
+import os
+import random
+import threading
+
+from contextlib import asynccontextmanager
+from fastapi import Request
+from typing import AsyncIterator, List
+
+from abstractions.utility import IUtility
+
+from constants.profiling import Profiling
+
+from start_utils import (
+    PROFILING_DIR,
+    PROFILING_MAX_FILES,
+    PROFILING_SAMPLE_RATE,
+    PROFILING_TOKEN,
+)
+
+# cProfile can only have one active profiler per interpreter, so at most one
+# request is captured at a time; concurrent candidates are simply skipped.
+_profiling_lock = threading.Lock()
+
+
+class ProfilerUtility(IUtility):
+
+    def __init__(self, urn: str = None, api_name: str = None) -> None:
+        super().__init__(urn, api_name)
+        self.requested = False
+
+    def should_profile(self, request: Request) -> bool:
+
+        token: str = request.headers.get(Profiling.HEADER)
+        # Starlette decodes headers as latin-1; compare raw bytes so non-ASCII
+        # values are a plain mismatch instead of a TypeError.
+        if PROFILING_TOKEN and token and hmac.compare_digest(
+            token.encode("latin-1"), PROFILING_TOKEN.encode("utf-8")
+        ):
+            self.logger.debug("Profiling requested via header")
+            self.requested = True
+            return True
+
+        if PROFILING_SAMPLE_RATE > 0 and random.random() < PROFILING_SAMPLE_RATE:
+            self.logger.debug("Profiling selected by sample rate")
+            return True
+
+        return False
+
+    @asynccontextmanager
+    async def profile(self) -> AsyncIterator[None]:
+
+        if not _profiling_lock.acquire(blocking=False):
+            if self.requested:
+                self.logger.warning("Another request is being profiled, skipping requested profile")
+            else:
+                self.logger.debug("Another request is being profiled, skipping")
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+        finally:
+            _profiling_lock.release()
+
+        await asyncio.to_thread(self.__dump, profiler=profiler)
+
+    def __dump(self, profiler: cProfile.Profile) -> None:
+
+        try:
+
+            os.makedirs(PROFILING_DIR, exist_ok=True)
+            path: str = os.path.join(
+                PROFILING_DIR,
+                f"{Profiling.FILE_PREFIX}{self.urn}{Profiling.FILE_SUFFIX}"
+            )
+
+            self.logger.debug("Writing profile")
+            profiler.dump_stats(path)
+            self.logger.info(f"Wrote profile to {path}")
+
+            self.__prune()
+
+        except OSError as err:
+            self.logger.error(f"Failed to write profile: {err}")
+
+    def __prune(self) -> None:
+        """
+        Keep only the newest PROFILING_MAX_FILES profiles in PROFILING_DIR.
+        """
+        profiles: List[str] = [
+            os.path.join(PROFILING_DIR, name)
+            for name in os.listdir(PROFILING_DIR)
+            if name.startswith(Profiling.FILE_PREFIX) and name.endswith(Profiling.FILE_SUFFIX)
+        ]
+        if len(profiles) <= PROFILING_MAX_FILES:
+            return
+
+        profiles.sort(key=os.path.getmtime, reverse=True)
+        self.logger.debug("Pruning old profiles")
+        for path in profiles[PROFILING_MAX_FILES:]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.logger.debug("Pruned old profiles")